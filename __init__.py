@@ -15,25 +15,86 @@ import bpy
 import os
 import shutil
 import stat
+import glob
 import tempfile
+import contextlib
 import zipfile
 import urllib.request
+import urllib.parse
+import urllib.error
+import http.client
 import threading
+import concurrent.futures
 import json
+import time
+from dataclasses import dataclass, fields
 from datetime import datetime
+from typing import Any, Optional
 from bpy.types import Operator, Panel, AddonPreferences
 from bpy.props import StringProperty, EnumProperty
 import webbrowser
 
 
 # Global progress tracking
-_download_progress = 0.0
-_download_status = ""
-_is_downloading = False
+@dataclass(slots=True)
+class _DownloadState:
+    """Install progress and result, shared by the worker thread, operator and panel."""
+    progress: float = 0.0
+    status: str = ""
+    is_downloading: bool = False
+    finished: bool = False
+    success: bool = False
+    error_msg: str = ""
+    release_info: Optional[dict] = None
+    timer: Any = None
+    window: Any = None
+    last_pct: int = -1
+    drawn: Any = None
+    run: int = 0
+    
+    def reset(self, window):
+        """Start tracking a new install for the given window."""
+        run = self.run + 1
+        for field in fields(self):
+            setattr(self, field.name, field.default)
+        self.run = run
+        self.status = "Initializing..."
+        self.is_downloading = True
+        self.window = window
+
+
+_STATE = _DownloadState()
+
+# Cached colormanagement paths, resolved on first use
+_cm_path = None
+_config_paths = None
+
+# Shared HTTP state, created on first use
+_opener = None
+_api_connection = None
+_api_generation = 0
+_api_lock = threading.Lock()
+
+# Install state shown in the panel, refreshed at most once per INSTALL_STATE_TTL
+INSTALL_STATE_TTL = 1.0
+_path_cache = {'t': None, 'config': False, 'marker': False, 'version': None}
+
+# Parsed version file as ((mtime_ns, size), data)
+_version_info_cache = None
 
 # Version info file name
 VERSION_FILE = ".aio_ocio_version.json"
 
+# Prefix of the staging folder created next to colormanagement during install
+STAGING_PREFIX = ".aio_ocio_staging_"
+
+# Config Blender loads, and the AIO config that is linked to it
+CONFIG_FILE = "config.ocio"
+AIO_CONFIG_FILE = "config_CG_Lin709.ocio"
+
+# Display names for the ocio_source preference
+SOURCE_NAMES = {'AIO_OCIO': 'AIO-OCIO', 'PIXELMANAGER': 'PixelManager', 'CUSTOM': 'Custom OCIO'}
+
 # Repository URLs
 REPO_AIO_OCIO = "https://github.com/RolandVyens/AIO-OCIO"
 REPO_PIXELMANAGER = "https://github.com/Joegenco/PixelManager"
@@ -41,6 +102,21 @@ REPO_PIXELMANAGER = "https://github.com/Joegenco/PixelManager"
 # Network timeout in seconds
 NETWORK_TIMEOUT = 30
 
+# Sent with every GitHub request
+USER_AGENT = 'AIO-OCIO-Installer'
+
+# Downloads larger than this spill from memory to a temp file
+MAX_IN_MEMORY_DOWNLOAD = 200 * 1024 * 1024
+
+# Downloads smaller than this only report progress at start and end
+SMALL_DOWNLOAD_SIZE = 512 * 1024
+
+# Seconds between main-thread checks for new download progress
+PROGRESS_POLL_INTERVAL = 0.5
+
+# Upper bound on threads used to write extracted files
+EXTRACT_WORKERS = 8
+
 
 def get_releases_api_url(repo_url):
     """Convert GitHub repo URL to releases API URL.
@@ -86,10 +162,67 @@ def get_colormanagement_path():
     """Get the path to Blender's colormanagement folder.
     
     Prioritizes USER location to avoid permission issues with system installs.
+    The path is resolved once and cached, since the panel asks on every redraw.
     """
-    user_path = bpy.utils.resource_path('USER')
-    cm_path = os.path.join(user_path, 'datafiles', 'colormanagement')
-    return cm_path
+    global _cm_path
+    if _cm_path is None:
+        user_path = bpy.utils.resource_path('USER')
+        _cm_path = os.path.join(user_path, 'datafiles', 'colormanagement')
+    return _cm_path
+
+
+def get_config_paths():
+    """Get cached (config.ocio, config_CG_Lin709.ocio) paths inside colormanagement."""
+    global _config_paths
+    if _config_paths is None:
+        cm_path = get_colormanagement_path()
+        _config_paths = (
+            os.path.join(cm_path, CONFIG_FILE),
+            os.path.join(cm_path, AIO_CONFIG_FILE),
+        )
+    return _config_paths
+
+
+def tag_properties_redraw():
+    """Redraw every Properties editor."""
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'PROPERTIES':
+                area.tag_redraw()
+
+
+def poll_download_progress():
+    """Main-thread bpy.app.timers callback that redraws when progress changes.
+    
+    The worker thread only writes _STATE and never calls into bpy, since
+    Blender's timer list isn't safe to modify from another thread. Once the
+    worker has finished, this ends the install and wakes the modal
+    operator so it can report the result.
+    """
+    shown = (_STATE.last_pct, _STATE.status)
+    if shown != _STATE.drawn:
+        _STATE.drawn = shown
+        tag_properties_redraw()
+    
+    if not _STATE.finished:
+        return PROGRESS_POLL_INTERVAL
+    
+    # Clear the flag here rather than in modal(), so the panel recovers
+    # even if the modal handler is gone
+    _STATE.is_downloading = False
+    tag_properties_redraw()
+    
+    # Timer events are the only way to reach a modal handler, so arm a
+    # single one now that there is a result to report. window is cleared
+    # when the modal handler was cancelled, e.g. by loading a file
+    if _STATE.window is not None:
+        try:
+            wm = bpy.context.window_manager
+            _STATE.timer = wm.event_timer_add(0.0, window=_STATE.window)
+        except (ReferenceError, RuntimeError):
+            # The window was closed; its modal handler went with it
+            _STATE.timer = None
+    return None
 
 
 def rmtree_force(path):
@@ -105,22 +238,163 @@ def rmtree_force(path):
     shutil.rmtree(path, onerror=on_rm_error)
 
 
+def _rmtrees_on_thread(paths):
+    """Delete directory trees on a daemon thread, ignoring errors."""
+    def remove():
+        for path in paths:
+            try:
+                rmtree_force(path)
+            except Exception:
+                pass
+    
+    threading.Thread(target=remove, daemon=True).start()
+
+
+def rmtree_in_background(path):
+    """Move a directory tree out of the way and delete it on a daemon thread.
+    
+    The rename is instant, so callers can reuse the original path right away.
+    If it can't be renamed, the tree is deleted in place instead.
+    """
+    trash_path = f"{path}.trash_{os.getpid()}_{time.time_ns()}"
+    try:
+        os.rename(path, trash_path)
+    except OSError:
+        rmtree_force(path)
+        return
+    
+    _rmtrees_on_thread([trash_path])
+
+
+def remove_leftover_trash(path):
+    """Delete trash folders rmtree_in_background(path) left behind.
+    
+    A daemon delete stops when Blender quits, so earlier sessions can leave
+    partial trash folders next to path.
+    """
+    leftovers = glob.glob(glob.escape(path) + ".trash_*")
+    if leftovers:
+        _rmtrees_on_thread(leftovers)
+
+
+def remove_leftover_staging(parent_dir):
+    """Delete staging folders an interrupted install left in parent_dir.
+    
+    The install thread is a daemon, so quitting Blender mid-install skips its
+    cleanup.
+    """
+    leftovers = glob.glob(os.path.join(glob.escape(parent_dir), STAGING_PREFIX + "*"))
+    if leftovers:
+        _rmtrees_on_thread(leftovers)
+
+
+def link_or_copy(src, dst):
+    """Hardlink src to dst, falling back to a copy where links aren't supported."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def extract_zipball(zip_file, dest_dir, progress_callback=None):
+    """Extract a GitHub zipball into dest_dir, dropping the top-level folder.
+    
+    zip_file can be a path or a seekable file object. Entries are streamed
+    straight to their final location, so each file is written once, and
+    files are written by a small thread pool to overlap inflate and disk I/O.
+    progress_callback(done, total) is called as files complete.
+    Returns the set of extracted file paths, relative to dest_dir with "/"
+    separators.
+    """
+    dest_root = os.path.abspath(dest_dir)
+    
+    with zipfile.ZipFile(zip_file, 'r') as zip_ref:
+        # Create folders up front so workers only ever write files. Sorting
+        # keeps a folder's files mostly together, and makedirs only runs when
+        # the target folder changes from the previous file's
+        jobs = []
+        last_dir = None
+        for info in sorted(zip_ref.infolist(), key=lambda i: i.filename):
+            # Folders are created from file paths; git never has empty ones
+            if info.is_dir():
+                continue
+            
+            # GitHub wraps everything in "<owner>-<repo>-<sha>/"
+            parts = info.filename.split('/', 1)
+            if len(parts) < 2 or not parts[1]:
+                continue
+            
+            target = os.path.abspath(os.path.join(dest_root, parts[1]))
+            # Skip entries that would escape the destination folder
+            if not target.startswith(dest_root + os.sep):
+                continue
+            
+            target_dir = os.path.dirname(target)
+            if target_dir != last_dir:
+                os.makedirs(target_dir, exist_ok=True)
+                last_dir = target_dir
+            jobs.append((info, target))
+        
+        # ZipFile serializes reads of its underlying file, so members can be
+        # opened from several threads at once; decompression runs in parallel
+        def extract_one(info, target):
+            with zip_ref.open(info) as src, open(target, 'wb') as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+        
+        max_workers = min(EXTRACT_WORKERS, os.cpu_count() or 1)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(extract_one, info, target) for info, target in jobs]
+            last_step = -1
+            for done, future in enumerate(concurrent.futures.as_completed(futures), 1):
+                try:
+                    future.result()
+                except Exception:
+                    # Fail fast instead of writing the rest of the queue first
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    raise
+                step = done * 100 // len(jobs)
+                if progress_callback and step != last_step:
+                    last_step = step
+                    progress_callback(done, len(jobs))
+    
+    return {info.filename.split('/', 1)[1] for info, _target in jobs}
+
+
 def get_version_info():
-    """Get installed version info from version file."""
+    """Get installed version info from version file.
+    
+    The parsed file is cached and only re-read when its mtime or size changes.
+    """
+    global _version_info_cache
     cm_path = get_colormanagement_path()
     version_file = os.path.join(cm_path, VERSION_FILE)
     
-    if os.path.exists(version_file):
-        try:
-            with open(version_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception:
-            pass
-    return None
+    try:
+        st = os.stat(version_file)
+    except OSError:
+        _version_info_cache = None
+        return None
+    
+    file_key = (st.st_mtime_ns, st.st_size)
+    if _version_info_cache is not None and _version_info_cache[0] == file_key:
+        return _version_info_cache[1]
+    
+    data = None
+    try:
+        with open(version_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except Exception:
+        pass
+    _version_info_cache = (file_key, data)
+    return data
 
 
-def save_version_info(tag_name, published_date, source_name):
-    """Save version info to version file."""
+def save_version_info(tag_name, published_date, source_name, release_info=None):
+    """Save version info to version file.
+    
+    release_info is kept alongside so the next update check can be conditional.
+    """
+    global _version_info_cache
     cm_path = get_colormanagement_path()
     version_file = os.path.join(cm_path, VERSION_FILE)
     
@@ -130,44 +404,200 @@ def save_version_info(tag_name, published_date, source_name):
         "installed_date": datetime.now().isoformat(),
         "source": source_name,
     }
+    if release_info:
+        version_data["release"] = release_info
     
     try:
         with open(version_file, 'w', encoding='utf-8') as f:
             json.dump(version_data, f, indent=2)
     except Exception:
         pass
+    
+    # Don't rely on mtime granularity to notice the rewrite
+    _version_info_cache = None
+
+
+def get_cached_release_info(api_url):
+    """Get the release info saved with the installed config, if it came from api_url."""
+    version_info = get_version_info()
+    if version_info:
+        release = version_info.get("release")
+        if release and release.get("api_url") == api_url and release.get("etag"):
+            return release
+    return None
+
+
+def get_opener():
+    """Get the shared urllib opener, with the User-Agent already installed."""
+    global _opener
+    if _opener is None:
+        _opener = urllib.request.build_opener()
+        _opener.addheaders = [('User-Agent', USER_AGENT)]
+    return _opener
+
+
+def api_get(url, headers=None, max_redirects=5):
+    """GET a small HTTP(S) resource over a kept-alive connection.
+    
+    The connection is reused across calls to the same host, so repeated
+    update checks skip the TCP and TLS handshakes. Redirects are followed.
+    Returns (status, headers, body).
+    """
+    global _api_connection
+    headers = {'User-Agent': USER_AGENT, **(headers or {})}
+    
+    for _redirect in range(max_redirects + 1):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme == 'https':
+            connection_class = http.client.HTTPSConnection
+        elif parts.scheme == 'http':
+            connection_class = http.client.HTTPConnection
+        else:
+            raise http.client.HTTPException(f"Unsupported URL scheme: {url}")
+        key = (parts.scheme, parts.hostname, parts.port)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        
+        # Take the kept-alive connection out of the slot; the lock is never
+        # held across network I/O
+        with _api_lock:
+            pooled, _api_connection = _api_connection, None
+            generation = _api_generation
+        conn = None
+        if pooled is not None:
+            if pooled[0] == key:
+                conn = pooled[1]
+            else:
+                pooled[1].close()
+        reused = conn is not None
+        
+        while True:
+            if conn is None:
+                conn = connection_class(parts.hostname, parts.port, timeout=NETWORK_TIMEOUT)
+            try:
+                conn.request('GET', path, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if not reused:
+                    raise
+                # The server dropped the kept-alive connection; retry once fresh
+                conn = None
+                reused = False
+            except Exception:
+                conn.close()
+                raise
+        
+        # Keep the connection for next time, unless it was closed meanwhile
+        with _api_lock:
+            if (not response.will_close and _api_connection is None
+                    and generation == _api_generation):
+                _api_connection = (key, conn)
+                conn = None
+        if conn is not None:
+            conn.close()
+        
+        location = response.getheader('Location')
+        if response.status in (301, 302, 303, 307, 308) and location:
+            url = urllib.parse.urljoin(url, location)
+            continue
+        return response.status, response.headers, body
+    
+    raise http.client.HTTPException(f"Too many redirects for {url}")
+
+
+def close_api_connection():
+    """Close the kept-alive API connection, if one is open.
+    
+    Doesn't wait for a request in flight; that connection is closed instead
+    of being kept once it finishes.
+    """
+    global _api_connection, _api_generation
+    with _api_lock:
+        pooled, _api_connection = _api_connection, None
+        _api_generation += 1
+    if pooled is not None:
+        pooled[1].close()
 
 
 def get_latest_release_info(api_url):
     """Fetch latest release info from GitHub API.
     
-    Returns dict with tag_name, published_at, and zipball_url.
+    Sends the ETag saved from the last install as If-None-Match, so an
+    unchanged release costs a tiny 304 response that GitHub doesn't count
+    against the rate limit.
+    
+    Returns dict with tag_name, published_at, zipball_url, and etag.
     """
+    cached = get_cached_release_info(api_url)
     try:
-        request = urllib.request.Request(
-            api_url,
-            headers={'User-Agent': 'AIO-OCIO-Installer'}
-        )
-        response = urllib.request.urlopen(request, timeout=NETWORK_TIMEOUT)
-        data = json.loads(response.read().decode('utf-8'))
+        headers = {}
+        if cached:
+            headers['If-None-Match'] = cached["etag"]
+        
+        if api_url.startswith('https://'):
+            status, response_headers, body = api_get(api_url, headers)
+        else:
+            request = urllib.request.Request(api_url, headers=headers)
+            try:
+                response = get_opener().open(request, timeout=NETWORK_TIMEOUT)
+                status, response_headers, body = response.status, response.headers, response.read()
+            except urllib.error.HTTPError as e:
+                # urllib reports 304 Not Modified as an error
+                if e.code != 304:
+                    raise
+                status, response_headers, body = e.code, e.headers, b""
+        
+        if status == 304 and cached:
+            return dict(cached)
+        if status != 200:
+            return None
+        
+        data = json.loads(body.decode('utf-8'))
         return {
             "tag_name": data.get("tag_name", ""),
             "published_at": data.get("published_at", ""),
             "zipball_url": data.get("zipball_url", ""),
             "name": data.get("name", ""),
+            "etag": response_headers.get('ETag', ""),
+            "api_url": api_url,
         }
     except Exception:
         return None
 
 
-def download_with_progress(url, dest_path, progress_callback):
-    """Download a file with progress reporting."""
+def get_install_state():
+    """Get cached config/marker existence and version info for the panel.
+    
+    The panel redraws often, so the filesystem is checked at most once per
+    INSTALL_STATE_TTL seconds.
+    """
+    now = time.monotonic()
+    if _path_cache['t'] is None or now - _path_cache['t'] > INSTALL_STATE_TTL:
+        config_path, aio_marker = get_config_paths()
+        has_config = os.path.exists(config_path)
+        _path_cache['config'] = has_config
+        _path_cache['marker'] = os.path.exists(aio_marker)
+        _path_cache['version'] = get_version_info() if has_config else None
+        _path_cache['t'] = now
+    return _path_cache
+
+
+def invalidate_install_state():
+    """Force the next get_install_state() call to re-check the filesystem."""
+    _path_cache['t'] = None
+
+
+def download_with_progress(url, dest, progress_callback):
+    """Download a file with progress reporting.
+    
+    dest can be a file path or an already open, writable binary file object.
+    """
     try:
-        request = urllib.request.Request(
-            url,
-            headers={'User-Agent': 'AIO-OCIO-Installer'}
-        )
-        response = urllib.request.urlopen(request, timeout=NETWORK_TIMEOUT)
+        response = get_opener().open(url, timeout=NETWORK_TIMEOUT)
         total_size = response.getheader('Content-Length')
         
         if total_size:
@@ -176,29 +606,186 @@ def download_with_progress(url, dest_path, progress_callback):
             total_size = 0
         
         downloaded = 0
-        block_size = 8192
+        last_step = -1
+        # One large reusable block keeps read()/write() calls and
+        # allocations low
+        block_size = 1024 * 1024
+        buffer = bytearray(block_size)
+        view = memoryview(buffer)
+        
+        if isinstance(dest, (str, bytes, os.PathLike)):
+            sink = open(dest, 'wb')
+        else:
+            sink = contextlib.nullcontext(dest)
+        
+        # Small files finish too fast for incremental progress to be visible,
+        # so keep the caller's status until the download completes
+        report_steps = not (0 < total_size < SMALL_DOWNLOAD_SIZE)
         
-        with open(dest_path, 'wb') as f:
+        with sink as f:
             while True:
-                buffer = response.read(block_size)
-                if not buffer:
+                n = response.readinto(buffer)
+                if not n:
                     break
                 
-                downloaded += len(buffer)
-                f.write(buffer)
+                downloaded += n
+                f.write(view[:n])
+                
+                if not report_steps:
+                    continue
                 
                 if total_size > 0:
                     progress = downloaded / total_size
+                    step = int(progress * 100)
                 else:
                     progress = 0.5  # Unknown size, show 50%
+                    step = downloaded // (256 * 1024)
                 
-                progress_callback(progress, f"Downloading... {downloaded // 1024} KB")
+                # Only report when the visible percentage (or size) changes
+                if step != last_step:
+                    last_step = step
+                    progress_callback(progress, f"Downloading... {downloaded // 1024} KB")
+        
+        if not report_steps:
+            progress_callback(1.0, f"Downloading... {downloaded // 1024} KB")
         
         return True, ""
     except Exception as e:
         return False, str(e)
 
 
+def update_progress(progress, status):
+    """Update progress from download thread."""
+    _STATE.progress = progress
+    _STATE.status = status
+    
+    # Picked up by poll_download_progress() on the main thread
+    _STATE.last_pct = int(progress * 100)
+
+
+def update_extract_progress(done, total):
+    """Map extraction progress onto the 70-80% range of the bar."""
+    update_progress(0.7 + 0.1 * done / total, f"Extracting files... {done}/{total}")
+
+
+def download_and_install(repo_url, source_name):
+    """Background thread for download and installation.
+    
+    Settings are read on the main thread and passed in, so this never
+    touches bpy.
+    """
+    temp_dir = None
+    zip_buffer = None
+    try:
+        if not repo_url:
+            _STATE.error_msg = "No repository URL configured. Please set a custom URL in preferences."
+            return
+        
+        api_url = get_releases_api_url(repo_url)
+        
+        # Get latest release info
+        update_progress(0.0, "Checking latest release...")
+        _STATE.release_info = get_latest_release_info(api_url)
+        
+        if not _STATE.release_info or not _STATE.release_info.get("zipball_url"):
+            _STATE.error_msg = "Failed to get release info from GitHub"
+            return
+        
+        zipball_url = _STATE.release_info["zipball_url"]
+        
+        # Get destination path
+        cm_path = get_colormanagement_path()
+        backup_path = cm_path + "_backup"
+        remove_leftover_trash(backup_path)
+        
+        # Ensure parent directory exists
+        parent_dir = os.path.dirname(cm_path)
+        if not os.path.exists(parent_dir):
+            os.makedirs(parent_dir, exist_ok=True)
+        
+        remove_leftover_staging(parent_dir)
+        
+        # Download into memory, spilling to disk only for huge archives
+        zip_buffer = tempfile.SpooledTemporaryFile(max_size=MAX_IN_MEMORY_DOWNLOAD)
+        update_progress(0.05, f"Downloading {_STATE.release_info.get('tag_name', '')}...")
+        success, error = download_with_progress(
+            zipball_url, 
+            zip_buffer, 
+            update_progress
+        )
+        
+        if not success:
+            _STATE.error_msg = f"Download failed: {error}"
+            return
+        
+        # Stage next to cm_path so installing is a same-filesystem rename
+        temp_dir = tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=parent_dir)
+        
+        # Extract
+        update_progress(0.7, "Extracting files...")
+        zip_buffer.seek(0)
+        staging_dir = os.path.join(temp_dir, "staging")
+        extracted = extract_zipball(zip_buffer, staging_dir, update_extract_progress)
+        if not extracted:
+            _STATE.error_msg = "No files found in downloaded archive"
+            return
+        
+        zip_buffer.close()
+        zip_buffer = None
+        
+        # Link config file for Blender while still staging, using what the
+        # extraction already found instead of re-checking the installed tree
+        if AIO_CONFIG_FILE in extracted:
+            config_dest = os.path.join(staging_dir, CONFIG_FILE)
+            if CONFIG_FILE in extracted:
+                os.remove(config_dest)
+            link_or_copy(os.path.join(staging_dir, AIO_CONFIG_FILE), config_dest)
+        
+        update_progress(0.8, "Backing up existing config...")
+        
+        # Backup existing if present
+        if os.path.exists(cm_path):
+            if os.path.exists(backup_path):
+                rmtree_in_background(backup_path)
+            os.replace(cm_path, backup_path)
+        
+        update_progress(0.9, "Installing new config...")
+        
+        # Move extracted files into place (atomic rename, no copy)
+        os.replace(staging_dir, cm_path)
+        
+        # Save version info with source name
+        if _STATE.release_info:
+            save_version_info(
+                _STATE.release_info.get("tag_name", "unknown"),
+                _STATE.release_info.get("published_at", ""),
+                source_name,
+                _STATE.release_info
+            )
+        
+        invalidate_install_state()
+        update_progress(1.0, "Installation complete!")
+        _STATE.success = True
+    
+    except Exception as e:
+        _STATE.error_msg = str(e)
+    finally:
+        if zip_buffer is not None:
+            zip_buffer.close()
+        
+        # Cleanup temp directory
+        if temp_dir and os.path.exists(temp_dir):
+            try:
+                rmtree_force(temp_dir)
+            except Exception:
+                pass
+        
+        # Set last, after all cleanup, so the next install can't start while
+        # this thread still touches _STATE. poll_download_progress() then
+        # clears is_downloading on the main thread
+        _STATE.finished = True
+
+
 class OCIO_Preferences(AddonPreferences):
     """Addon preferences for AIO-OCIO Installer."""
     bl_idname = __package__
@@ -253,177 +840,71 @@ class OCIO_OT_install_update(Operator):
     bl_description = "Download and install the latest OCIO color configuration from GitHub"
     bl_options = {'REGISTER'}
     
-    def update_progress(self, progress, status):
-        """Update progress from download thread."""
-        global _download_progress, _download_status
-        _download_progress = progress
-        _download_status = status
-    
-    def download_and_install(self):
-        """Background thread for download and installation."""
-        global _download_progress, _download_status, _is_downloading
-        
-        temp_dir = None
-        try:
-            # Get repo URL from preferences
-            repo_url = get_repo_url()
-            
-            if not repo_url:
-                self._error_msg = "No repository URL configured. Please set a custom URL in preferences."
-                self._finished = True
-                return
-            
-            api_url = get_releases_api_url(repo_url)
-            
-            # Get latest release info
-            self.update_progress(0.0, "Checking latest release...")
-            self._release_info = get_latest_release_info(api_url)
-            
-            if not self._release_info or not self._release_info.get("zipball_url"):
-                self._error_msg = "Failed to get release info from GitHub"
-                self._finished = True
-                return
-            
-            zipball_url = self._release_info["zipball_url"]
-            
-            # Create temp directory
-            temp_dir = tempfile.mkdtemp(prefix="aio_ocio_")
-            zip_path = os.path.join(temp_dir, "aio_ocio.zip")
-            
-            # Download
-            self.update_progress(0.05, f"Downloading {self._release_info.get('tag_name', '')}...")
-            success, error = download_with_progress(
-                zipball_url, 
-                zip_path, 
-                self.update_progress
-            )
-            
-            if not success:
-                self._error_msg = f"Download failed: {error}"
-                self._finished = True
-                return
-            
-            # Extract
-            self.update_progress(0.7, "Extracting files...")
-            extract_dir = os.path.join(temp_dir, "extracted")
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
-            
-            # Find the extracted folder (GitHub adds -master suffix)
-            extracted_folders = os.listdir(extract_dir)
-            if not extracted_folders:
-                self._error_msg = "No files found in downloaded archive"
-                self._finished = True
-                return
-            
-            source_dir = os.path.join(extract_dir, extracted_folders[0])
-            
-            # Get destination path
-            cm_path = get_colormanagement_path()
-            backup_path = cm_path + "_backup"
-            
-            self.update_progress(0.8, "Backing up existing config...")
-            
-            # Ensure parent directory exists
-            parent_dir = os.path.dirname(cm_path)
-            if not os.path.exists(parent_dir):
-                os.makedirs(parent_dir, exist_ok=True)
-            
-            # Backup existing if present
-            if os.path.exists(cm_path):
-                if os.path.exists(backup_path):
-                    rmtree_force(backup_path)
-                shutil.move(cm_path, backup_path)
-            
-            self.update_progress(0.9, "Installing new config...")
-            
-            # Copy new files
-            shutil.copytree(source_dir, cm_path)
-            
-            # Rename config file for Blender
-            config_source = os.path.join(cm_path, "config_CG_Lin709.ocio")
-            config_dest = os.path.join(cm_path, "config.ocio")
-            
-            if os.path.exists(config_source):
-                if os.path.exists(config_dest):
-                    os.remove(config_dest)
-                shutil.copy2(config_source, config_dest)
-            
-            # Save version info with source name
-            if self._release_info:
-                prefs = get_addon_preferences()
-                source_name = prefs.ocio_source if prefs else 'AIO_OCIO'
-                save_version_info(
-                    self._release_info.get("tag_name", "unknown"),
-                    self._release_info.get("published_at", ""),
-                    source_name
-                )
-            
-            self.update_progress(1.0, "Installation complete!")
-            self._success = True
-            
-        except Exception as e:
-            self._error_msg = str(e)
-        finally:
-            # Cleanup temp directory
-            if temp_dir and os.path.exists(temp_dir):
-                try:
-                    rmtree_force(temp_dir)
-                except Exception:
-                    pass
-            
-            self._finished = True
-            _is_downloading = False
-    
     def modal(self, context, event):
-        global _is_downloading
+        # A newer install replaced this one's result; nothing left to report
+        if self._run != _STATE.run:
+            return {'FINISHED'}
         
-        if event.type == 'TIMER':
-            # Redraw UI to show progress
-            for area in context.screen.areas:
-                if area.type == 'PROPERTIES':
-                    area.tag_redraw()
+        if event.type == 'TIMER' and _STATE.finished and _STATE.timer is not None:
+            context.window_manager.event_timer_remove(_STATE.timer)
+            _STATE.timer = None
             
-            if self._finished:
-                context.window_manager.event_timer_remove(self._timer)
-                _is_downloading = False
-                
-                if self._success:
-                    self.report({'INFO'}, "AIO-OCIO installed successfully! Restart Blender to apply changes.")
-                else:
-                    self.report({'ERROR'}, f"Installation failed: {self._error_msg}")
-                
-                return {'FINISHED'}
+            if _STATE.success:
+                self.report({'INFO'}, "AIO-OCIO installed successfully! Restart Blender to apply changes.")
+            else:
+                self.report({'ERROR'}, f"Installation failed: {_STATE.error_msg}")
+            
+            return {'FINISHED'}
         
         return {'PASS_THROUGH'}
     
-    def execute(self, context):
-        global _is_downloading, _download_progress, _download_status
+    def cancel(self, context):
+        """Blender dropped the modal handler, e.g. on file load or window close."""
+        if self._run != _STATE.run:
+            return
         
-        if _is_downloading:
+        if _STATE.timer is not None:
+            context.window_manager.event_timer_remove(_STATE.timer)
+            _STATE.timer = None
+        # Nobody is left to wake; the poller still ends the install
+        _STATE.window = None
+        if _STATE.finished:
+            _STATE.is_downloading = False
+    
+    def execute(self, context):
+        if _STATE.is_downloading:
             self.report({'WARNING'}, "Download already in progress")
             return {'CANCELLED'}
         
-        self._timer = None
-        self._thread = None
-        self._finished = False
-        self._success = False
-        self._error_msg = ""
-        self._release_info = None
+        # Drop a wake-up timer the previous run's modal() never consumed
+        if _STATE.timer is not None:
+            context.window_manager.event_timer_remove(_STATE.timer)
         
-        _is_downloading = True
-        _download_progress = 0.0
-        _download_status = "Initializing..."
+        _STATE.reset(context.window)
+        self._run = _STATE.run
+        
+        # Read settings here; the worker thread must not use bpy
+        prefs = get_addon_preferences()
+        source_name = prefs.ocio_source if prefs else 'AIO_OCIO'
+        get_colormanagement_path()
         
         # Start background thread
-        self._thread = threading.Thread(target=self.download_and_install)
-        self._thread.daemon = True
-        self._thread.start()
+        thread = threading.Thread(
+            target=download_and_install,
+            args=(get_repo_url(), source_name)
+        )
+        thread.daemon = True
+        thread.start()
         
-        # Setup timer for modal updates
-        wm = context.window_manager
-        self._timer = wm.event_timer_add(0.1, window=context.window)
-        wm.modal_handler_add(self)
+        # Redraw from the main thread as progress changes, and finish modal() when
+        # done. Persistent so loading a file mid-install doesn't drop it
+        if not bpy.app.timers.is_registered(poll_download_progress):
+            bpy.app.timers.register(
+                poll_download_progress,
+                first_interval=PROGRESS_POLL_INTERVAL,
+                persistent=True
+            )
+        context.window_manager.modal_handler_add(self)
         
         return {'RUNNING_MODAL'}
 
@@ -442,41 +923,42 @@ class OCIO_PT_Installer(Panel):
         return context.scene is not None
     
     def draw(self, context):
-        global _is_downloading, _download_progress, _download_status
-        
         layout = self.layout
         
-        if _is_downloading:
+        if _STATE.is_downloading:
             # Show progress with text-based bar
             col = layout.column(align=True)
-            col.label(text=_download_status)
+            
+            # Nothing measurable yet, so show a generic label instead of a bar
+            if _STATE.progress < 0.01:
+                col.label(text="Downloading...")
+                return
+            
+            col.label(text=_STATE.status)
             
             # Create a visual progress bar using text
-            progress_pct = int(_download_progress * 100)
+            progress_pct = int(_STATE.progress * 100)
             bar_width = 20
-            filled = int(_download_progress * bar_width)
+            filled = int(_STATE.progress * bar_width)
             bar = "█" * filled + "░" * (bar_width - filled)
             col.label(text=f"[{bar}] {progress_pct}%")
         else:
             # Show install button
-            cm_path = get_colormanagement_path()
-            config_path = os.path.join(cm_path, "config.ocio")
+            install_state = get_install_state()
             
             # Get current source name for display
             prefs = get_addon_preferences()
             if prefs:
-                source_names = {'AIO_OCIO': 'AIO-OCIO', 'PIXELMANAGER': 'PixelManager', 'CUSTOM': 'Custom OCIO'}
-                current_source = source_names.get(prefs.ocio_source, 'OCIO')
+                current_source = SOURCE_NAMES.get(prefs.ocio_source, 'OCIO')
             else:
                 current_source = 'OCIO'
             
-            if os.path.exists(config_path):
+            if install_state['config']:
                 # Check version info to see what's installed
-                version_info = get_version_info()
+                version_info = install_state['version']
                 if version_info:
                     installed_source = version_info.get("source", "")
-                    source_names = {'AIO_OCIO': 'AIO-OCIO', 'PIXELMANAGER': 'PixelManager', 'CUSTOM': 'Custom OCIO'}
-                    installed_name = source_names.get(installed_source, 'OCIO Config')
+                    installed_name = SOURCE_NAMES.get(installed_source, 'OCIO Config')
                     
                     layout.label(text=f"{installed_name} is installed", icon='CHECKMARK')
                     
@@ -486,8 +968,7 @@ class OCIO_PT_Installer(Panel):
                         layout.label(text=f"Version: {tag} ({installed})")
                 else:
                     # No version info, check for marker file
-                    aio_marker = os.path.join(cm_path, "config_CG_Lin709.ocio")
-                    if os.path.exists(aio_marker):
+                    if install_state['marker']:
                         layout.label(text="OCIO Config installed", icon='CHECKMARK')
                     else:
                         layout.label(text="Custom OCIO detected", icon='INFO')
@@ -521,6 +1002,11 @@ def register():
 def unregister():
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
+    
+    if bpy.app.timers.is_registered(poll_download_progress):
+        bpy.app.timers.unregister(poll_download_progress)
+    
+    close_api_connection()
 
 
 if __name__ == "__main__":